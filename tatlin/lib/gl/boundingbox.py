@@ -16,14 +16,17 @@
 # Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  USA
 
 
+import numpy
+
+
 class BoundingBox(object):
     """
     A rectangular box (cuboid) enclosing a 3D model, defined by lower and upper corners.
     """
 
     def __init__(self, upper_corner, lower_corner):
-        self.upper_corner = upper_corner
-        self.lower_corner = lower_corner
+        self.upper_corner = numpy.asarray(upper_corner, dtype=numpy.float32)
+        self.lower_corner = numpy.asarray(lower_corner, dtype=numpy.float32)
 
     @property
     def width(self):
@@ -80,6 +80,21 @@ class Model(object):
         box = BoundingBox(upper_corner, lower_corner)
         return box
 
+    def display_bounds(self, mode_2d=False):
+        """
+        Return lower and upper corners of the bounding box as the model is
+        displayed, i.e. translated by its offsets. In 2D mode z is discarded.
+        """
+        offset_z = self.offset_z if not mode_2d else 0
+        offset = numpy.array([self.offset_x, self.offset_y, offset_z], "f")
+
+        lower_corner = self.bounding_box.lower_corner + offset
+        upper_corner = self.bounding_box.upper_corner + offset
+        if mode_2d:
+            lower_corner[2] = upper_corner[2] = 0.0
+
+        return lower_corner, upper_corner
+
     @property
     def width(self):
         return self.bounding_box.width
@@ -20,15 +20,17 @@ import math
 from typing import Any
 import logging
 
+import numpy
 from OpenGL.GL import *  # type:ignore
 from OpenGL.GLU import *  # type:ignore
 from OpenGL.GLUT import *  # type:ignore
+from OpenGL.arrays.vbo import VBO
 
 from tatlin.lib.ui.basescene import BaseScene
 
 from .model import Model
 from .views import View2D, View3D
-from .util import html_color
+from .util import aabb_in_frustum, compile_display_list, frustum_planes, html_color
 
 
 class Scene(BaseScene):
@@ -42,28 +44,54 @@ class Scene(BaseScene):
 
     PAN_SPEED = 25
     ROTATE_SPEED = 25
+    AXIS_LENGTH = 50.0
+    AXIS_COLORS = ((1.0, 0.0, 0.0), (0.0, 1.0, 0.0), tuple(html_color("008aff")))
+
+    # glutInit() only needs to be called once per process
+    _glut_initialized = False
 
     def __init__(self, parent):
         super(Scene, self).__init__(parent)
 
         self.model: Any = None
         self.actors = []
+        # immutable snapshot of actors for iterating in the render loop
+        self._actor_tuple = ()
         self.cursor_x = 0
         self.cursor_y = 0
+        # mouse movement multipliers, precomputed for motion events
+        self._pan_scale = self.PAN_SPEED / 100
+        self._rotate_scale = self.ROTATE_SPEED / 100
 
         self.view_ortho = View2D()
         self.view_perspective = View3D()
         self.current_view = self.view_perspective
 
+        # (axis end point, color, label character code) for each axis
+        length = self.AXIS_LENGTH
+        self._axes_geometry = tuple(
+            zip(
+                [(-length, 0.0, 0.0), (0.0, -length, 0.0), (0.0, 0.0, length)],
+                self.AXIS_COLORS,
+                [ord(label) for label in "xyz"],
+            )
+        )
+
+        # last view state and the eye height calculated for it
+        self._eye_height_cache = (None, 0.0)
+
     def add_model(self, model):
         self.model = model
         self.actors.append(self.model)
+        self._actor_tuple = tuple(self.actors)
 
     def add_supporting_actor(self, actor):
         self.actors.append(actor)
+        self._actor_tuple = tuple(self.actors)
 
     def clear(self):
         self.actors = []
+        self._actor_tuple = ()
 
     # ------------------------------------------------------------------------
     # DRAWING
@@ -81,10 +109,27 @@ class Scene(BaseScene):
         glEnable(GL_BLEND)
         glBlendFunc(GL_SRC_ALPHA, GL_ONE_MINUS_SRC_ALPHA)
 
+        if not Scene._glut_initialized:
+            glutInit()
+            Scene._glut_initialized = True
+
+        self.init_axes()
         self.init_actors()
 
         self.initialized = True
 
+    def init_axes(self):
+        """
+        Upload axis lines to a VBO, interleaving vertex positions and colors.
+        """
+        data = []
+        for axis, color, _ in self._axes_geometry:
+            data.append((0.0, 0.0, 0.0) + color)
+            data.append(axis + color)
+
+        self.axes_buffer = VBO(numpy.require(data, "f"), "GL_STATIC_DRAW")
+        self.axis_labels_list = compile_display_list(self.draw_axis_labels)
+
     def init_actors(self):
         for actor in self.actors:
             if not actor.initialized:
@@ -101,8 +146,6 @@ class Scene(BaseScene):
         # see: http://www.opengl.org/resources/faq/technical/lights.htm#ligh0090
         glEnable(GL_RESCALE_NORMAL)
 
-        glutInit()
-
         self.view_ortho.begin(w, h)
         self.draw_axes()
         self.view_ortho.end()
@@ -111,21 +154,17 @@ class Scene(BaseScene):
         self.current_view.display_transform()
 
         if self.mode_ortho:
-            for actor in self.actors:
-                actor.display(
-                    elevation=-self.current_view.elevation,
-                    mode_ortho=self.mode_ortho,
-                    mode_2d=self.mode_2d,
-                )
+            kwargs = {
+                "elevation": -self.current_view.elevation,
+                "mode_ortho": self.mode_ortho,
+                "mode_2d": self.mode_2d,
+            }
         else:
             # actors may use eye height to perform rendering optimizations; in
             # the simplest terms, in the most convenient definitions, eye
             # height in the perspective projection divides the screen into two
             # horizontal halves - one seen from above, the other from below
-            y = self.current_view.y / self.current_view.zoom_factor
-            z = self.current_view.z
-            angle = -math.degrees(math.atan2(z, y)) - self.current_view.elevation
-            eye_height = math.sqrt(y**2 + z**2) * math.sin(math.radians(angle))
+            eye_height = self.eye_height()
 
             # draw line of sight plane
             """
@@ -146,47 +185,76 @@ class Scene(BaseScene):
             #glEnd()
             """
 
-            for actor in self.actors:
-                actor.display(
-                    eye_height=eye_height,
-                    mode_ortho=self.mode_ortho,
-                    mode_2d=self.mode_2d,
-                )
+            kwargs = {
+                "eye_height": eye_height,
+                "mode_ortho": self.mode_ortho,
+                "mode_2d": self.mode_2d,
+            }
+
+        planes = frustum_planes(
+            glGetFloatv(GL_PROJECTION_MATRIX), glGetFloatv(GL_MODELVIEW_MATRIX)
+        )
+        for actor in self._actor_tuple:
+            # skip models that are completely outside the view frustum
+            if isinstance(actor, Model) and not aabb_in_frustum(
+                planes, *actor.display_bounds(self.mode_2d)
+            ):
+                continue
+            actor.display(**kwargs)
 
         self.current_view.end()
 
+    def eye_height(self):
+        """
+        Return eye height for the current view, recalculating it only when
+        the view has changed since the last call.
+        """
+        view = self.current_view
+        key = (view.y, view.z, view.zoom_factor, view.elevation)
+
+        cached_key, eye_height = self._eye_height_cache
+        if key != cached_key:
+            y = view.y / view.zoom_factor
+            z = view.z
+            # this is r * sin(-atan2(z, y) - elevation) where r = sqrt(y^2 + z^2),
+            # expanded with the sine of sum identity
+            elevation = math.radians(view.elevation)
+            eye_height = -(z * math.cos(elevation) + y * math.sin(elevation))
+            self._eye_height_cache = (key, eye_height)
+
+        return eye_height
+
     def reshape(self, w, h):
         glViewport(0, 0, w, h)
 
-    def draw_axes(self, length=50.0):
+    def draw_axes(self):
         glPushMatrix()
-        self.current_view.ui_transform(length)
+        self.current_view.ui_transform(self.AXIS_LENGTH)
 
-        axes = [
-            (-length, 0.0, 0.0),
-            (0.0, -length, 0.0),
-            (0.0, 0.0, length),
-        ]
-        colors = [(1.0, 0.0, 0.0), (0.0, 1.0, 0.0), html_color("008aff")]
-        labels = ["x", "y", "z"]
+        # each vertex is 6 floats (24 bytes): position followed by color
+        self.axes_buffer.bind()
+        glVertexPointer(3, GL_FLOAT, 24, self.axes_buffer)
+        glColorPointer(3, GL_FLOAT, 24, self.axes_buffer + 12)
 
-        glBegin(GL_LINES)
+        glEnableClientState(GL_VERTEX_ARRAY)
+        glEnableClientState(GL_COLOR_ARRAY)
 
-        for axis, color in zip(axes, colors):
-            glColor(*color)
-            glVertex(0.0, 0.0, 0.0)
-            glVertex(*axis)
+        glDrawArrays(GL_LINES, 0, 6)
+
+        glDisableClientState(GL_COLOR_ARRAY)
+        glDisableClientState(GL_VERTEX_ARRAY)
+        self.axes_buffer.unbind()
 
-        glEnd()
+        glCallList(self.axis_labels_list)
+
+        glPopMatrix()
 
-        # draw axis labels
-        for label, axis, color in zip(labels, axes, colors):
+    def draw_axis_labels(self):
+        for axis, color, label_code in self._axes_geometry:
             glColor(*color)
             # add padding to labels
             glRasterPos(axis[0] + 2, axis[1] + 2, axis[2] + 2)
-            glutBitmapCharacter(GLUT_BITMAP_8_BY_13, ord(label))  # type:ignore
-
-        glPopMatrix()
+            glutBitmapCharacter(GLUT_BITMAP_8_BY_13, label_code)  # type:ignore
 
     # ------------------------------------------------------------------------
     # VIEWING MANIPULATIONS
@@ -202,17 +270,15 @@ class Scene(BaseScene):
 
         if left:
             self.current_view.rotate(
-                delta_x * self.ROTATE_SPEED / 100, delta_y * self.ROTATE_SPEED / 100
+                delta_x * self._rotate_scale, delta_y * self._rotate_scale
             )
         elif middle:
             if hasattr(self.current_view, "offset"):
                 self.current_view.offset(  # type:ignore
-                    delta_x * self.PAN_SPEED / 100, delta_y * self.PAN_SPEED / 100
+                    delta_x * self._pan_scale, delta_y * self._pan_scale
                 )
         elif right:
-            self.current_view.pan(
-                delta_x * self.PAN_SPEED / 100, delta_y * self.PAN_SPEED / 100
-            )
+            self.current_view.pan(delta_x * self._pan_scale, delta_y * self._pan_scale)
 
         self.cursor_x = x
         self.cursor_y = y
@@ -266,12 +332,20 @@ class Scene(BaseScene):
         """
         Display the model in the center of the scene without modifying the vertices.
         """
+        offset_x, offset_y, offset_z = self.model_center_offset()
+        self.model.offset_x = offset_x
+        self.model.offset_y = offset_y
+        self.model.offset_z = offset_z
+
+    def model_center_offset(self):
+        """
+        Return offset that puts the model in the center of the platform and
+        raises its lowest point to z=0.
+        """
         bounding_box = self.model.bounding_box
-        lower_corner = bounding_box.lower_corner
-        upper_corner = bounding_box.upper_corner
-        self.model.offset_x = -(upper_corner[0] + lower_corner[0]) / 2
-        self.model.offset_y = -(upper_corner[1] + lower_corner[1]) / 2
-        self.model.offset_z = -lower_corner[2]
+        offset = -(bounding_box.upper_corner + bounding_box.lower_corner) / 2
+        offset[2] = -bounding_box.lower_corner[2]
+        return offset.tolist()
 
     # ------------------------------------------------------------------------
     # MODEL MANIPULATION
@@ -292,13 +366,7 @@ class Scene(BaseScene):
         """
         Center the model on platform and raise its lowest point to z=0.
         """
-        bounding_box = self.model.bounding_box
-        lower_corner = bounding_box.lower_corner
-        upper_corner = bounding_box.upper_corner
-        offset_x = -(upper_corner[0] + lower_corner[0]) / 2
-        offset_y = -(upper_corner[1] + lower_corner[1]) / 2
-        offset_z = -lower_corner[2]
-        self.model.translate(offset_x, offset_y, offset_z)
+        self.model.translate(*self.model_center_offset())
         self.model.init()
 
     def change_model_dimension(self, dimension, value):
@@ -40,7 +40,9 @@ class StlModel(Model):
         vertices, normals = model_data
         # convert python lists to numpy arrays for constructing vbos
         self.vertices = numpy.require(vertices, "f")
-        self.normals = numpy.require(normals, "f")
+        # all 3 vertices of a facet share the same normal, so only one normal
+        # per facet is stored
+        self.facet_normals = numpy.require(normals, "f")
 
         self.scaling_factor = 1.0
         self.rotation_angle = {
@@ -65,24 +67,29 @@ class StlModel(Model):
         """
         Return true if the model has no normal data.
         """
-        empty = self.normals.max() == 0 and self.normals.min() == 0
+        empty = self.facet_normals.max() == 0 and self.facet_normals.min() == 0
         return empty
 
     def calculate_normals(self):
         """
-        Calculate surface normals for model vertices.
+        Calculate surface normals for model facets.
         """
         a = self.vertices[0::3] - self.vertices[1::3]
         b = self.vertices[1::3] - self.vertices[2::3]
         cross = numpy.cross(a, b)
 
         # normalize the cross product
-        magnitudes = numpy.apply_along_axis(numpy.linalg.norm, 1, cross).reshape(-1, 1)
+        magnitudes = numpy.linalg.norm(cross, axis=1, keepdims=True)
         normals = cross / magnitudes
+        return normals
 
+    def normals_for_gl(self):
+        """
+        Return normals expanded to one per vertex, as required by the normal
+        array.
+        """
         # each of 3 facet vertices shares the same normal
-        normals = normals.repeat(3, 0)
-        return normals
+        return self.facet_normals.repeat(3, 0)
 
     # ------------------------------------------------------------------------
     # DRAWING
@@ -96,9 +103,9 @@ class StlModel(Model):
 
         if self.normal_data_empty():
             logging.info("STL model has no normal data")
-            self.normals = self.calculate_normals()
+            self.facet_normals = self.calculate_normals()
 
-        self.normal_buffer = VBO(self.normals, "GL_STATIC_DRAW")
+        self.normal_buffer = VBO(self.normals_for_gl(), "GL_STATIC_DRAW")
         self.initialized = True
 
     def draw_facets(self):
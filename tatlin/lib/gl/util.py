@@ -16,6 +16,7 @@
 # Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  USA
 
 
+import numpy
 from OpenGL.GL import *  # type:ignore
 from OpenGL.GLE import *  # type:ignore
 
@@ -41,3 +42,37 @@ def html_color(color):
         color = color[1:]
     parsed = [int(c, 16) / 255 for c in paginate(color, 2)]
     return parsed
+
+
+def frustum_planes(projection, modelview):
+    """
+    Extract the six clipping planes of the view frustum from projection and
+    modelview matrices as returned by glGetFloatv (column-major).
+
+    Each plane is a row (a, b, c, d) such that points with ax + by + cz + d >= 0
+    are on the inner side.
+    """
+    # transpose column-major OpenGL matrices to get the row-major clip matrix
+    clip = numpy.dot(modelview, projection).T
+    planes = numpy.array(
+        [
+            clip[3] + clip[0],  # left
+            clip[3] - clip[0],  # right
+            clip[3] + clip[1],  # bottom
+            clip[3] - clip[1],  # top
+            clip[3] + clip[2],  # near
+            clip[3] - clip[2],  # far
+        ]
+    )
+    return planes
+
+
+def aabb_in_frustum(planes, lower_corner, upper_corner):
+    """
+    Return true if an axis-aligned box is at least partially inside the frustum.
+    """
+    normals = planes[:, :3]
+    # for each plane, the box corner furthest along the plane normal
+    corners = numpy.where(normals >= 0, upper_corner, lower_corner)
+    distances = (normals * corners).sum(axis=1) + planes[:, 3]
+    return bool((distances >= 0).all())
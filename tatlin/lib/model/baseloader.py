@@ -1,6 +1,12 @@
 from abc import ABC, abstractmethod
 import os
 
+FILETYPES_BY_EXTENSION = {
+    ".gcode": "gcode",
+    ".nc": "gcode",
+    ".stl": "stl",
+}
+
 
 class ModelFileError(Exception):
     pass
@@ -16,7 +22,15 @@ class BaseModelLoader(ABC):
         self._dirname = None
         self._basename = None
         self._extension = None
-        self._size = None
+        self._stat = None
+
+    def _ensure_parts(self):
+        """
+        Split the path into directory, name and extension in one go.
+        """
+        if self._basename is None:
+            self._dirname, self._basename = os.path.split(self.path)
+            self._extension = os.path.splitext(self._basename)[-1].lower()
 
     @property
     def path(self):
@@ -29,20 +43,17 @@ class BaseModelLoader(ABC):
 
     @property
     def dirname(self):
-        if self._dirname is None:
-            self._dirname = os.path.dirname(self.path)
+        self._ensure_parts()
         return self._dirname
 
     @property
     def basename(self):
-        if self._basename is None:
-            self._basename = os.path.basename(self.path)
+        self._ensure_parts()
         return self._basename
 
     @property
     def extension(self):
-        if self._extension is None:
-            self._extension = os.path.splitext(self.basename)[-1].lower()
+        self._ensure_parts()
         return self._extension
 
     @property
@@ -59,9 +70,9 @@ class BaseModelLoader(ABC):
         """
         File size in bytes.
         """
-        if self._size is None:
-            self._size = os.path.getsize(self.path)
-        return self._size
+        if self._stat is None:
+            self._stat = os.stat(self.path)
+        return self._stat.st_size
 
     @abstractmethod
     def load(self, scene, read_cb, load_cb):
@@ -71,7 +82,8 @@ class BaseModelLoader(ABC):
 def determine_filetype(fpath):
     ext = os.path.splitext(fpath)[-1].lower()
 
-    if ext not in [".gcode", ".nc", ".stl"]:
+    ftype = FILETYPES_BY_EXTENSION.get(ext)
+    if ftype is None:
         raise ModelFileError(f"Unsupported file extension: {ext}")
 
-    return "gcode" if ext in (".gcode", ".nc") else "stl"
+    return ftype
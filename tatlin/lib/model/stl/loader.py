@@ -19,13 +19,18 @@ from tatlin.lib.gl.stlmodel import StlModel
 from tatlin.lib.ui.stl import StlPanel
 
 from ..baseloader import BaseModelLoader, ModelFileError
-from .parser import StlParseError, StlParser
+from .parser import StlBinaryParser, StlParseError, StlParser
 
 
 class STLModelLoader(BaseModelLoader):
+    # whether the file is in binary format; used to save the file back in the
+    # same format
+    binary = False
+
     def load(self, config, scene, progress_dlg):
         with open(self.path, "rb") as stlfile:
             parser = StlParser(stlfile)
+            self.binary = isinstance(parser, StlBinaryParser)
             parser.load(stlfile)
             try:
                 progress_dlg.stage("Reading file...")
@@ -22,12 +22,24 @@ Parser for STL (stereolithography) files.
 import struct
 import time
 import logging
-import math
+import mmap
 from io import StringIO
 
+import numpy
+
 
 ENCODING = "utf-8"
 
+# layout of a single 50-byte facet record in a binary STL file: twelve 32-bit
+# floats and one 16-bit unsigned short
+FACET_DTYPE = numpy.dtype(
+    [
+        ("normal", "<f4", (3,)),
+        ("vertices", "<f4", (3, 3)),
+        ("attr", "<u2"),
+    ]
+)
+
 
 class StlParseError(Exception):
     pass
@@ -101,7 +113,8 @@ class StlAsciiParser(object):
 
     def parse(self, callback=None):
         """
-        Parse the file into a tuple of normal and facet lists.
+        Parse the file into a tuple of vertex and normal lists: one vertex per
+        facet corner and one normal per facet.
         """
         t_start = time.time()
 
@@ -168,8 +181,16 @@ class StlAsciiParser(object):
                 self.line_no, 'expected "%s", got "%s"' % ("endfacet", line[0])
             )
 
+        # each facet carries a single normal, so it has to be a triangle for
+        # vertices and normals to line up
+        if len(self.vertex_list) != 3:
+            raise InvalidTokenError(
+                self.line_no,
+                "expected 3 vertices per facet, got %d" % len(self.vertex_list),
+            )
+
         self.facet_list.extend(self.vertex_list)
-        self.normal_list.extend([self.facet_normal] * len(self.vertex_list))
+        self.normal_list.append(self.facet_normal)
 
         if self.callback and self.line_no >= self.callback_next:
             self.callback_next += self.callback_every
@@ -216,7 +237,6 @@ class StlBinaryParser(object):
 
     HEADER_LEN = 80
     FACET_COUNT_LEN = 4  # one 32-bit unsigned int
-    FACET_LEN = 50  # twelve 32-bit floats + one 16-bit short unsigned int
 
     def load(self, stl):
         if not hasattr(stl, "read"):
@@ -225,55 +245,54 @@ class StlBinaryParser(object):
 
     def parse(self, callback=None):
         """
-        Parse the file into a tuple of normal and facet lists.
+        Parse the file into a tuple of vertex and normal arrays: vertices have
+        shape (3 * facet count, 3) and normals (facet count, 3).
         """
         t_start = time.time()
 
-        normal_list = []
-        facet_list = []
-
-        self._skip_header(self.stl)
-        fcount = self._facet_count(self.stl)
-        callback_every = max(1, int(math.floor(fcount / 100)))
-        for facet_idx in range(fcount):
-            vertices, normal = self._parse_facet(self.stl)
-            facet_list.extend(vertices)
-            normal_list.extend([normal] * len(vertices))  # one normal per vertex
+        data = self._map(self.stl)
+        try:
+            fcount = self._facet_count(data)
+            try:
+                facets = numpy.frombuffer(
+                    data,
+                    dtype=FACET_DTYPE,
+                    count=fcount,
+                    offset=self.HEADER_LEN + self.FACET_COUNT_LEN,
+                )
+            except ValueError:
+                raise StlParseError("Error unpacking binary STL data")
 
-            if callback and (facet_idx + 1) % callback_every == 0:
-                callback(facet_idx + 1, fcount)
+            # copy the data out of the file buffer so that it can be closed
+            vertices = numpy.array(facets["vertices"].reshape(-1, 3))
+            normals = facets["normal"].copy()
+            del facets
+        finally:
+            if isinstance(data, mmap.mmap):
+                data.close()
 
         if callback:
-            callback(facet_idx + 1, fcount)
+            callback(fcount, fcount)
 
         t_end = time.time()
         logging.info("Parsed STL binary file in %.2f seconds" % (t_end - t_start))
 
-        return facet_list, normal_list
+        return vertices, normals
 
-    def _skip_header(self, fp):
-        fp.seek(self.HEADER_LEN)
-
-    def _facet_count(self, fp):
-        raw = fp.read(self.FACET_COUNT_LEN)
+    def _map(self, fp):
+        """
+        Memory-map the file if possible, otherwise read it into memory.
+        """
         try:
-            (count,) = struct.unpack("<I", raw)
-            return count
-        except struct.error:
-            raise StlParseError("Error unpacking binary STL data")
+            return mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ)
+        except (AttributeError, OSError, ValueError):
+            fp.seek(0)
+            return fp.read()
 
-    def _parse_facet(self, fp):
-        raw = fp.read(self.FACET_LEN)
+    def _facet_count(self, data):
         try:
-            vertex_data = struct.unpack("<ffffffffffffH", raw)
-            normal = [vertex_data[0], vertex_data[1], vertex_data[2]]
-            vertices = []
-            for i in range(3, 12, 3):
-                vertices.append(
-                    [vertex_data[i], vertex_data[i + 1], vertex_data[i + 2]]
-                )
-            # ignore the attribute byte count...
-            return vertices, normal
+            (count,) = struct.unpack_from("<I", data, self.HEADER_LEN)
+            return count
         except struct.error:
             raise StlParseError("Error unpacking binary STL data")
 
@@ -15,46 +15,66 @@
 # along with this program; if not, write to the Free Software Foundation,
 # Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  USA
 
+import numpy
+
 from tatlin.lib.gl.stlmodel import StlModel
 
+from .parser import FACET_DTYPE
+
+FACET_TEMPLATE = b"""facet normal %.6f %.6f %.6f
+  outer loop
+    vertex %.6f %.6f %.6f
+    vertex %.6f %.6f %.6f
+    vertex %.6f %.6f %.6f
+  endloop
+endfacet
+"""
+
+WRITE_BUFFER_SIZE = 1 << 20
+
+# must not start with "solid", otherwise the file would be mistaken for ASCII STL
+BINARY_HEADER = b"Binary STL written by Tatlin".ljust(80, b" ")
+
 
 class STLModelWriter(object):
-    def __init__(self, path, filetype):
+    def __init__(self, path, filetype, binary=False):
         self.path = path
         self.filetype = filetype
+        self.binary = binary
 
     def write(self, model: StlModel):
+        self.write_data(model.vertices, model.facet_normals)
+        model.modified = False
+
+    def write_data(self, vertices, facet_normals):
+        """
+        Write vertex and per-facet normal arrays to file.
+        """
         assert self.filetype == "stl"
 
-        vertices, normals = model.vertices, model.normals
-
-        f = open(self.path, "w")
-        print("solid", file=f)
-        print(
-            "".join(
-                [
-                    self._format_facet(vertices[i : i + 3], normals[i])
-                    for i in range(0, len(vertices), 3)
-                ]
-            ),
-            file=f,
-        )
-        print("endsolid", file=f)
-        f.close()
+        if self.binary:
+            self._write_binary(vertices, facet_normals)
+        else:
+            self._write_ascii(vertices, facet_normals)
 
-        model.modified = False
+    def _write_binary(self, vertices, facet_normals):
+        facets = numpy.zeros(len(vertices) // 3, dtype=FACET_DTYPE)
+        facets["normal"] = facet_normals
+        facets["vertices"] = vertices.reshape(-1, 3, 3)
 
-    def _format_facet(self, vertices, normal):
-        template = """facet normal %.6f %.6f %.6f
-  outer loop
-    %s
-  endloop
-endfacet
-"""
-        stl_facet = template % (
-            normal[0],
-            normal[1],
-            normal[2],
-            "\n".join(["vertex %.6f %.6f %.6f" % (v[0], v[1], v[2]) for v in vertices]),
-        )
-        return stl_facet
+        with open(self.path, "wb") as f:
+            f.write(BINARY_HEADER)
+            numpy.array([len(facets)], dtype="<u4").tofile(f)
+            facets.tofile(f)
+
+    def _write_ascii(self, vertices, facet_normals):
+        # one row per facet: normal followed by the three vertices, so that
+        # the whole facet can be formatted in one go
+        facets = numpy.hstack([facet_normals, vertices.reshape(-1, 9)])
+
+        # stream facets through a large buffer instead of building the whole
+        # file in memory
+        with open(self.path, "wb", buffering=WRITE_BUFFER_SIZE) as f:
+            f.write(b"solid\n")
+            f.writelines(FACET_TEMPLATE % tuple(facet.tolist()) for facet in facets)
+            f.write(b"endsolid\n")
@@ -52,6 +52,15 @@ class OpenErrorAlert(wx.MessageDialog):
         self.ShowModal()
 
 
+class SaveErrorAlert(wx.MessageDialog):
+    def __init__(self, fpath, error):
+        msg = "Error saving file %s: %s" % (fpath, error)
+        super(SaveErrorAlert, self).__init__(None, msg, "Error", wx.OK | wx.ICON_ERROR)
+
+    def show(self):
+        self.ShowModal()
+
+
 class SaveDialog(wx.FileDialog):
     def __init__(self, parent, directory=None):
         super(SaveDialog, self).__init__(
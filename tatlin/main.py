@@ -20,6 +20,7 @@ import sys
 import os
 import os.path
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 
 from tatlin.conf.rendering import configure_backend
@@ -51,6 +52,7 @@ from tatlin.lib.ui.dialogs import (
     AboutDialog,
     ProgressDialog,
     OpenErrorAlert,
+    SaveErrorAlert,
 )
 
 from tatlin.lib.util import format_status, get_recent_files, resolve_path
@@ -81,6 +83,11 @@ class App(BaseApp):
         self.window.set_size((window_w, window_h))
         self.init_scene()
 
+        # files are written in the background to keep the UI responsive
+        self.io_pool = ThreadPoolExecutor(max_workers=1)
+        # (future, model, file path) of the save in progress
+        self.pending_save: Any = None
+
     def init_config(self):
         fname = os.path.expanduser(os.path.join("~", ".tatlin"))
         self.config = Config(fname)
@@ -115,6 +122,8 @@ class App(BaseApp):
     # -------------------------------------------------------------------------
 
     def on_file_open(self, event=None):
+        self.finish_save()
+
         if self.save_changes_dialog():
             show_again = True
             while show_again:
@@ -131,9 +140,12 @@ class App(BaseApp):
         """
         Save changes to the same file.
         """
-        writer = STLModelWriter(self.model_loader.path, self.model_loader.filetype)
-        writer.write(self.scene.model)
-        self.window.file_modified = False
+        writer = STLModelWriter(
+            self.model_loader.path,
+            self.model_loader.filetype,
+            self.model_loader.binary,
+        )
+        self.save_model(writer)
 
     def on_file_save_as(self, event=None):
         """
@@ -142,13 +154,15 @@ class App(BaseApp):
         dialog = SaveDialog(self.window, self.current_dir)
         fpath = dialog.get_path()
         if fpath:
+            # keep the format of the original file
+            binary = self.model_loader.binary
             self.model_loader = ModelLoader(fpath)
+            self.model_loader.binary = binary
 
-            writer = STLModelWriter(fpath, self.model_loader.filetype)
-            writer.write(self.scene.model)
+            writer = STLModelWriter(fpath, self.model_loader.filetype, binary)
+            self.save_model(writer)
 
             self.window.filename = self.model_loader.basename
-            self.window.file_modified = False
 
     def on_quit(self, event=None):
         """
@@ -176,7 +190,12 @@ class App(BaseApp):
                 "Could not write settings to config file %s" % self.config.fname
             )
 
+        # if a pending save fails, the model is marked as modified again and
+        # the user gets asked what to do with the changes
+        self.finish_save()
+
         if self.save_changes_dialog():
+            self.io_pool.shutdown(wait=True)
             self.window.quit()
 
     def save_changes_dialog(self):
@@ -188,9 +207,11 @@ class App(BaseApp):
                 response = dialog.show()
                 if response == QuitDialog.RESPONSE_SAVE:
                     self.on_file_save()
-                    ask_again = False
+                    self.finish_save()
+                    ask_again = self.scene.model_modified
                 elif response == QuitDialog.RESPONSE_SAVE_AS:
                     self.on_file_save_as()
+                    self.finish_save()
                     ask_again = self.scene.model_modified
                 elif response == QuitDialog.RESPONSE_CANCEL:
                     ask_again = False
@@ -210,6 +231,51 @@ class App(BaseApp):
     # FILE OPERATIONS
     # -------------------------------------------------------------------------
 
+    def save_model(self, writer):
+        """
+        Write the current model to file in a background thread.
+        """
+        # only one save at a time; wait for the previous one to finish
+        self.finish_save()
+
+        model = self.scene.model
+        # copy the data so that the model can be modified while it's being saved
+        vertices, facet_normals = model.vertices.copy(), model.facet_normals.copy()
+        model.modified = False
+        self.window.file_modified = False
+
+        future = self.io_pool.submit(writer.write_data, vertices, facet_normals)
+        self.pending_save = (future, model, writer.path)
+        future.add_done_callback(lambda f: wx.CallAfter(self.finish_save, f))
+
+    def finish_save(self, future=None):
+        """
+        Wait for the pending save to finish and report an error if it failed.
+
+        When called with a future, only handle it if it belongs to the pending
+        save. Return false if the save failed.
+        """
+        if self.pending_save is None:
+            return True
+
+        pending_future, model, fpath = self.pending_save
+        if future is not None and future is not pending_future:
+            return True  # already handled
+
+        self.pending_save = None
+        error = pending_future.exception()  # blocks until the write is done
+        if error is None:
+            return True
+
+        logging.error("Could not save file %s: %s" % (fpath, error))
+        model.modified = True
+        # a different file might have been opened in the meantime
+        if self.scene is not None and model is self.scene.model:
+            self.window.file_modified = True
+
+        SaveErrorAlert(fpath, error).show()
+        return False
+
     def update_recent_files(self, fpath, ftype=None):
         self.recent_files = [f for f in self.recent_files if f[1] != fpath]
         self.recent_files.insert(0, (os.path.basename(fpath), fpath, ftype))
@@ -217,6 +283,10 @@ class App(BaseApp):
         self.window.update_recent_files_menu(self.recent_files)
 
     def open_and_display_file(self, fpath, ftype=None):
+        # don't read a file that is still being written or discard a model
+        # whose save may yet fail
+        self.finish_save()
+
         self.set_wait_cursor()
         progress_dialog = ProgressDialog()
         success = True
@@ -20,10 +20,14 @@ class ModelLoaderTest(unittest.TestCase):
         model_loader = ModelLoader("tests/fixtures/stl/top.stl")
         model_loader.load(self.config, Mock(), Mock())
 
+        self.assertFalse(model_loader.binary)
+
     def test_binary_stl(self):
         model_loader = ModelLoader("tests/fixtures/stl/cube-bin.stl")
         model_loader.load(self.config, Mock(), Mock())
 
+        self.assertTrue(model_loader.binary)
+
 
 if __name__ == "__main__":
     unittest.main()
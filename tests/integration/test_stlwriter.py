@@ -0,0 +1,52 @@
+import os
+import shutil
+import tempfile
+import unittest
+
+import numpy
+
+from tatlin.lib.model.stl.parser import StlAsciiParser, StlBinaryParser, StlParser
+from tatlin.lib.model.stl.writer import STLModelWriter
+
+
+def parse(path):
+    with open(path, "rb") as stlfile:
+        parser = StlParser(stlfile)
+        parser.load(stlfile)
+        vertices, normals = parser.parse()
+    return parser, numpy.require(vertices, "f"), numpy.require(normals, "f")
+
+
+class STLModelWriterTest(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.path = os.path.join(self.tmpdir, "out.stl")
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def assert_round_trip(self, fixture, binary, parser_class):
+        _, vertices, normals = parse(fixture)
+
+        writer = STLModelWriter(self.path, "stl", binary)
+        writer.write_data(vertices, normals)
+
+        parser, out_vertices, out_normals = parse(self.path)
+        self.assertIsInstance(parser, parser_class)
+        numpy.testing.assert_array_almost_equal(out_vertices, vertices, decimal=5)
+        numpy.testing.assert_array_almost_equal(out_normals, normals, decimal=5)
+
+    def test_binary(self):
+        self.assert_round_trip("tests/fixtures/stl/cube-bin.stl", True, StlBinaryParser)
+        self.assert_round_trip("tests/fixtures/stl/top.stl", True, StlBinaryParser)
+
+        with open(self.path, "rb") as f:
+            self.assertFalse(f.read(80).startswith(b"solid"))
+
+    def test_ascii(self):
+        self.assert_round_trip("tests/fixtures/stl/cube-bin.stl", False, StlAsciiParser)
+        self.assert_round_trip("tests/fixtures/stl/top.stl", False, StlAsciiParser)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,3 +1,4 @@
+import math
 import wx
 from unittest.mock import Mock
 from tatlin.lib.gl.boundingbox import BoundingBox
@@ -62,12 +63,47 @@ class SceneTest(GUITestCase):
     def test_rotate_view(self):
         self.scene.rotate_view(1, 1)
 
+    def test_eye_height(self):
+        view = self.scene.view_perspective
+
+        def expected_eye_height():
+            # the original formulation, before it was expanded algebraically
+            y = view.y / view.zoom_factor
+            angle = -math.degrees(math.atan2(view.z, y)) - view.elevation
+            return math.sqrt(y**2 + view.z**2) * math.sin(math.radians(angle))
+
+        for y, z, zoom_factor, elevation in [
+            (180.0, -20.0, 1.0, -20.0),
+            (-50.0, 30.0, 2.5, 45.0),
+            (10.0, 0.0, 0.5, -90.0),
+            (0.0, -75.0, 3.0, 120.0),
+        ]:
+            view.y, view.z = y, z
+            view.zoom_factor, view.elevation = zoom_factor, elevation
+            self.assertAlmostEqual(self.scene.eye_height(), expected_eye_height())
+
+        # the cached value is recalculated whenever the view changes
+        for attr, value in [
+            ("y", 40.0),
+            ("z", 15.0),
+            ("zoom_factor", 1.5),
+            ("elevation", -30.0),
+        ]:
+            previous = self.scene.eye_height()
+            setattr(view, attr, value)
+            self.assertNotAlmostEqual(self.scene.eye_height(), previous)
+            self.assertAlmostEqual(self.scene.eye_height(), expected_eye_height())
+
     def test_view_model_center(self):
         self.scene.model = Mock()
         self.scene.model.bounding_box = BoundingBox((1, 1, 1), (2, 3, 4))
 
         self.scene.view_model_center()
 
+        self.assertEqual(self.scene.model.offset_x, -1.5)
+        self.assertEqual(self.scene.model.offset_y, -2.0)
+        self.assertEqual(self.scene.model.offset_z, -4.0)
+
     def test_change_num_layers(self):
         self.scene.model = Mock()
         self.scene.change_num_layers(1)
@@ -15,7 +15,7 @@ class StlModelTest(GUITestCase):
         self.model.load_data(
             [
                 [[0, 0.5, 0], [0.5, -0.5, 0], [-0.5, -0.5, 0]],
-                [[0, 0, 1], [0, 0, 1], [0, 0, 1]],
+                [[0, 0, 1]],
             ]
         )
 
@@ -25,10 +25,27 @@ class StlModelTest(GUITestCase):
     def test_calculate_normals(self):
         normals = self.model.calculate_normals()
         numpy.testing.assert_array_almost_equal(
-            normals,
-            numpy.array([[0, 0, -1], [0, 0, -1], [0, 0, -1]], dtype=numpy.float32),
+            normals, numpy.array([[0, 0, -1]], dtype=numpy.float32)
         )
 
+    def test_normals_for_gl(self):
+        numpy.testing.assert_array_almost_equal(
+            self.model.normals_for_gl(),
+            numpy.array([[0, 0, 1], [0, 0, 1], [0, 0, 1]], dtype=numpy.float32),
+        )
+
+    def test_display_bounds(self):
+        self.model.offset_x = 1
+        self.model.offset_z = 2
+
+        lower_corner, upper_corner = self.model.display_bounds()
+        numpy.testing.assert_array_almost_equal(lower_corner, [0.5, -0.5, 2])
+        numpy.testing.assert_array_almost_equal(upper_corner, [1.5, 0.5, 2])
+
+        lower_corner, upper_corner = self.model.display_bounds(mode_2d=True)
+        numpy.testing.assert_array_almost_equal(lower_corner, [0.5, -0.5, 0])
+        numpy.testing.assert_array_almost_equal(upper_corner, [1.5, 0.5, 0])
+
     def test_init(self):
         self.model.init()
         self.assertTrue(self.model.initialized)
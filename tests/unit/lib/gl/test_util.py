@@ -1,5 +1,12 @@
 import unittest
-from tatlin.lib.gl.util import compile_display_list, html_color, paginate
+import numpy
+from tatlin.lib.gl.util import (
+    aabb_in_frustum,
+    compile_display_list,
+    frustum_planes,
+    html_color,
+    paginate,
+)
 
 
 class UtilTest(unittest.TestCase):
@@ -13,3 +20,22 @@ class UtilTest(unittest.TestCase):
     def test_html_color(self):
         self.assertEqual(html_color("#ff0000"), [1.0, 0, 0])
         self.assertEqual(html_color("ff0000"), [1.0, 0, 0])
+
+    def test_aabb_in_frustum(self):
+        # with identity matrices the frustum is a cube from -1 to 1
+        planes = frustum_planes(numpy.identity(4), numpy.identity(4))
+
+        self.assertTrue(aabb_in_frustum(planes, (-0.5, -0.5, -0.5), (0.5, 0.5, 0.5)))
+        self.assertTrue(aabb_in_frustum(planes, (0.5, 0.5, 0.5), (2, 2, 2)))
+        self.assertTrue(aabb_in_frustum(planes, (-2, -2, -2), (2, 2, 2)))
+        self.assertFalse(aabb_in_frustum(planes, (1.5, 0, 0), (2, 1, 1)))
+        self.assertFalse(aabb_in_frustum(planes, (0, 0, -3), (1, 1, -2)))
+
+    def test_frustum_planes_translated(self):
+        # move the scene 2 units along x; column-major like glGetFloatv
+        modelview = numpy.identity(4)
+        modelview[3, 0] = 2.0
+        planes = frustum_planes(numpy.identity(4), modelview)
+
+        self.assertFalse(aabb_in_frustum(planes, (0, 0, 0), (0.5, 0.5, 0.5)))
+        self.assertTrue(aabb_in_frustum(planes, (-2.5, 0, 0), (-2, 0.5, 0.5)))
@@ -0,0 +1,42 @@
+import unittest
+from io import BytesIO
+from tatlin.lib.model.stl.parser import InvalidTokenError, StlAsciiParser
+
+FACET = b"""  facet normal 0 0 1
+    outer loop
+%s    endloop
+  endfacet
+"""
+
+VERTEX = b"      vertex %d 0 0\n"
+
+
+def make_stl(*vertex_counts):
+    facets = b"".join(
+        FACET % b"".join(VERTEX % i for i in range(count)) for count in vertex_counts
+    )
+    return BytesIO(b"solid test\n" + facets + b"endsolid test\n")
+
+
+class StlAsciiParserTest(unittest.TestCase):
+    def parse(self, stl):
+        parser = StlAsciiParser()
+        parser.load(stl)
+        return parser.parse()
+
+    def test_parse(self):
+        vertices, normals = self.parse(make_stl(3, 3))
+
+        self.assertEqual(len(vertices), 6)
+        self.assertEqual(normals, [[0.0, 0.0, 1.0], [0.0, 0.0, 1.0]])
+
+    def test_parse_non_triangle_facet(self):
+        with self.assertRaises(InvalidTokenError):
+            self.parse(make_stl(3, 4))
+
+        with self.assertRaises(InvalidTokenError):
+            self.parse(make_stl(2))
+
+
+if __name__ == "__main__":
+    unittest.main()